@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Query, status, HTTPException
+
+from app.core.config import settings
+from app.schemas.stats import Granularity, SlugStatsResponse, TopLinksResponse
+from app.services.stats_service import get_click_series, get_top_links, max_buckets
+from app.exceptions.url_exceptions import NoLongUrlFoundError, DatabaseUnavailableError
+
+router = APIRouter(prefix="/api/v1", tags=["stats"])
+
+
+@router.get("/stats/top", response_model=TopLinksResponse)
+async def top_links(limit: int = Query(10, ge=1, le=100)):
+    try:
+        links = await get_top_links(limit)
+    except DatabaseUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service temporarily unavailable"
+        )
+    return TopLinksResponse(data=links)
+
+
+@router.get("/{slug}/stats", response_model=SlugStatsResponse)
+async def slug_stats(
+    slug: str,
+    granularity: Granularity = "hour",
+    buckets: int = Query(24, ge=1, le=settings.stats_max_buckets),
+):
+    if buckets > max_buckets(granularity):
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {max_buckets(granularity)} {granularity} buckets are available"
+        )
+    try:
+        stats = await get_click_series(slug, granularity, buckets)
+    except NoLongUrlFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No long url found"
+        )
+    except DatabaseUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service temporarily unavailable"
+        )
+    return SlugStatsResponse(data=stats)
@@ -1,26 +1,64 @@
-from fastapi import APIRouter, status, HTTPException
+from fastapi import APIRouter, Request, Response, status, HTTPException
 from fastapi.responses import RedirectResponse
 
+from app.core.config import settings
 from app.schemas.url import ShortUrlRequest, ShortUrlResponse
-from app.services.url_service import generate_short_url, get_url_by_slug
-from app.exceptions.url_exceptions import NoLongUrlFoundError
+from app.services.url_service import generate_short_url, get_short_url_by_slug
+from app.services.stats_service import click_buffer
+from app.exceptions.url_exceptions import NoLongUrlFoundError, DatabaseUnavailableError
+from app.utils.http_cache import format_http_date, is_not_modified, make_etag
 
 router = APIRouter(prefix="/api/v1", tags=["urls"])
 
 
 @router.post("/short_url", response_model=ShortUrlResponse)
 async def create_short_url(request: ShortUrlRequest):
-    new_slug = await generate_short_url(str(request.long_url))
+    try:
+        new_slug = await generate_short_url(str(request.long_url), request.redirect_status)
+    except DatabaseUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service temporarily unavailable"
+        )
     return ShortUrlResponse(data={"short_code": new_slug, "long_url": str(request.long_url)})
 
 
-@router.get("/{slug}")
-async def redirect_to_url(slug: str):
+@router.api_route("/{slug}", methods=["GET", "HEAD"])
+async def redirect_to_url(slug: str, request: Request):
     try:
-        long_url = await get_url_by_slug(slug)
+        short_url = await get_short_url_by_slug(slug)
     except NoLongUrlFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No long url found"
         )
-    return RedirectResponse(url=long_url, status_code=status.HTTP_302_FOUND)
+    except DatabaseUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service temporarily unavailable"
+        )
+
+    redirect_status = short_url.redirect_status or settings.redirect_status_code
+    etag = make_etag(short_url.slug, short_url.long_url, redirect_status)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": (
+            f"public, max-age={settings.redirect_cache_max_age}"
+            if settings.redirect_cache_max_age > 0 else "no-cache"
+        ),
+    }
+    if short_url.created_at is not None:
+        headers["Last-Modified"] = format_http_date(short_url.created_at)
+
+    # HEAD requests come from crawlers and caches, not from visitors
+    if request.method == "GET":
+        click_buffer.record(slug)
+
+    if is_not_modified(
+        etag,
+        short_url.created_at,
+        request.headers.get("If-None-Match"),
+        request.headers.get("If-Modified-Since"),
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return RedirectResponse(url=short_url.long_url, status_code=redirect_status, headers=headers)
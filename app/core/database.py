@@ -1,5 +1,24 @@
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.core.config import settings
+from app.utils.circuit_breaker import CircuitBreaker
 
-engine = create_async_engine(url=settings.database_url)
+# SQLite uses a pool without size limits
+pool_options = {} if settings.database_url.startswith("sqlite") else {
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+}
+engine = create_async_engine(url=settings.database_url, **pool_options)
 new_session = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+db_breaker = CircuitBreaker(
+    failure_threshold=settings.db_breaker_failure_threshold,
+    reset_timeout=settings.db_breaker_reset_timeout,
+    call_timeout=settings.db_breaker_call_timeout,
+)
+
+# Stats writes can be slow and must never trip the breaker that guards redirects
+stats_breaker = CircuitBreaker(
+    failure_threshold=settings.db_breaker_failure_threshold,
+    reset_timeout=settings.db_breaker_reset_timeout,
+    call_timeout=settings.db_breaker_call_timeout,
+)
@@ -1,11 +1,13 @@
 from app.exceptions.url_exceptions import (
     ShortnerBaseError,
     NoLongUrlFoundError,
-    SlugAlreadyExistsError
+    SlugAlreadyExistsError,
+    DatabaseUnavailableError
 )
 
 __all__ = [
     "ShortnerBaseError",
     "NoLongUrlFoundError",
-    "SlugAlreadyExistsError"
+    "SlugAlreadyExistsError",
+    "DatabaseUnavailableError"
 ]
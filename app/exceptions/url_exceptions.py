@@ -8,3 +8,7 @@ class NoLongUrlFoundError(ShortnerBaseError):
 
 class SlugAlreadyExistsError(ShortnerBaseError):
     pass
+
+
+class DatabaseUnavailableError(ShortnerBaseError):
+    pass
@@ -1,22 +1,48 @@
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.exc import SQLAlchemyError
 
-from app.core.database import engine
+from app.core.database import db_breaker, engine, stats_breaker
 from app.core.config import settings
-from app.models.url import Base
-from app.api.routes import urls
+from app.models import Base
+from app.api.routes import stats, urls
 from app.middleware.rate_limiter import RateLimitMiddleware
+from app.exceptions.url_exceptions import DatabaseUnavailableError
+from app.services.stats_service import click_buffer, run_stats_worker
+from app.services.url_service import url_snapshot, run_snapshot_worker
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as connection:
-        await connection.run_sync(Base.metadata.create_all)
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+    except (OSError, SQLAlchemyError):
+        # Start in degraded mode and serve redirects from the snapshot
+        logger.exception("Database unavailable on startup")
+    workers = [
+        asyncio.create_task(run_stats_worker()),
+        asyncio.create_task(run_snapshot_worker()),
+    ]
     yield
+    for worker in workers:
+        worker.cancel()
+    for worker in workers:
+        with suppress(asyncio.CancelledError):
+            await worker
+    try:
+        await click_buffer.flush()
+    except DatabaseUnavailableError:
+        logger.exception("Failed to flush link statistics on shutdown")
+    await engine.dispose()
 
 app = FastAPI(
     title=settings.api_title,
@@ -36,13 +62,21 @@ app.add_middleware(
 
 app.add_middleware(RateLimitMiddleware, calls=settings.rate_limit_calls, period=settings.rate_limit_period)
 
+app.include_router(stats.router)
 app.include_router(urls.router)
 app.include_router(urls.router, prefix="")
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "environment": settings.environment}
+    snapshot_age = url_snapshot.age
+    return {
+        "status": "healthy" if db_breaker.state == "closed" else "degraded",
+        "environment": settings.environment,
+        "database": db_breaker.state,
+        "stats_database": stats_breaker.state,
+        "snapshot_age_seconds": round(snapshot_age, 1) if snapshot_age is not None else None,
+    }
 
 # Serve frontend files
 frontend_path = Path(__file__).parent.parent / "frontend"
@@ -1,3 +1,4 @@
 from app.models.url import Base, ShortURL
+from app.models.stats import LinkClickBucket, LinkClickTotal
 
-__all__ = ["Base", "ShortURL"]
+__all__ = ["Base", "ShortURL", "LinkClickBucket", "LinkClickTotal"]
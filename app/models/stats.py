@@ -0,0 +1,23 @@
+from sqlalchemy import BigInteger, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.url import Base
+
+
+class LinkClickBucket(Base):
+    __tablename__ = 'link_click_buckets'
+    __table_args__ = (
+        Index('ix_link_click_buckets_granularity_bucket_start', 'granularity', 'bucket_start'),
+    )
+
+    slug: Mapped[str] = mapped_column(primary_key=True)
+    granularity: Mapped[str] = mapped_column(primary_key=True)
+    bucket_start: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    clicks: Mapped[int] = mapped_column(BigInteger, default=0)
+
+
+class LinkClickTotal(Base):
+    __tablename__ = 'link_click_totals'
+
+    slug: Mapped[str] = mapped_column(primary_key=True)
+    clicks: Mapped[int] = mapped_column(BigInteger, index=True, default=0)
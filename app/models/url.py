@@ -1,5 +1,7 @@
+from datetime import datetime
+
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import Index
+from sqlalchemy import DateTime, Index, func, text
 
 
 class Base(DeclarativeBase):
@@ -8,6 +10,12 @@ class Base(DeclarativeBase):
 
 class ShortURL(Base):
     __tablename__ = 'short_urls'
+    __table_args__ = (
+        # Byte-ordered scans for the redirect snapshot
+        Index('ix_short_urls_slug_c', text('slug COLLATE "C"')).ddl_if(dialect='postgresql'),
+    )
 
     slug: Mapped[str] = mapped_column(primary_key=True)
     long_url: Mapped[str] = mapped_column(index=True)
+    redirect_status: Mapped[int | None] = mapped_column(default=None)
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), server_default=func.now())
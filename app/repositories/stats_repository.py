@@ -0,0 +1,114 @@
+from collections import defaultdict
+from typing import Callable
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import new_session
+from app.models.stats import LinkClickBucket, LinkClickTotal
+
+# asyncpg allows at most 32767 bind parameters per statement
+UPSERT_BATCH_SIZE = 1000
+
+
+def _insert_for(session: AsyncSession):
+    # Both dialects expose the same ON CONFLICT DO UPDATE API
+    if session.bind.dialect.name == "sqlite":
+        return sqlite.insert
+    return postgresql.insert
+
+
+async def _upsert_buckets(session: AsyncSession, rows: list[dict]) -> None:
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        stmt = _insert_for(session)(LinkClickBucket).values(rows[start:start + UPSERT_BATCH_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["slug", "granularity", "bucket_start"],
+            set_={"clicks": LinkClickBucket.clicks + stmt.excluded.clicks},
+        )
+        await session.execute(stmt)
+
+
+async def _upsert_totals(session: AsyncSession, rows: list[dict]) -> None:
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        stmt = _insert_for(session)(LinkClickTotal).values(rows[start:start + UPSERT_BATCH_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["slug"],
+            set_={"clicks": LinkClickTotal.clicks + stmt.excluded.clicks},
+        )
+        await session.execute(stmt)
+
+
+async def add_clicks_to_db(
+    buckets: dict[tuple[str, str, int], int],
+    totals: dict[str, int],
+    on_commit: Callable[[], None] | None = None,
+) -> None:
+    async with new_session() as session:
+        await _upsert_buckets(session, [
+            {"slug": slug, "granularity": granularity, "bucket_start": bucket_start, "clicks": clicks}
+            for (slug, granularity, bucket_start), clicks in buckets.items()
+        ])
+        await _upsert_totals(session, [
+            {"slug": slug, "clicks": clicks} for slug, clicks in totals.items()
+        ])
+        if on_commit is not None:
+            on_commit()
+        await session.commit()
+
+
+async def compact_click_buckets_in_db(
+    source_granularity: str,
+    target_granularity: str,
+    target_seconds: int,
+    before: int,
+) -> int:
+    async with new_session() as session:
+        # Deleting and reading in one statement means concurrent runners
+        # never see the same source rows, so nothing is merged twice
+        result = await session.execute(
+            delete(LinkClickBucket)
+            .filter(
+                LinkClickBucket.granularity == source_granularity,
+                LinkClickBucket.bucket_start < before,
+            )
+            .returning(LinkClickBucket.slug, LinkClickBucket.bucket_start, LinkClickBucket.clicks)
+        )
+        merged: dict[tuple[str, int], int] = defaultdict(int)
+        for slug, bucket_start, clicks in result.all():
+            merged[(slug, bucket_start - bucket_start % target_seconds)] += clicks
+        await _upsert_buckets(session, [
+            {"slug": slug, "granularity": target_granularity, "bucket_start": start, "clicks": clicks}
+            for (slug, start), clicks in merged.items()
+        ])
+        await session.commit()
+        return len(merged)
+
+
+async def get_click_buckets_from_database(
+    slug: str,
+    granularities: list[str],
+    since: int,
+) -> list[tuple[int, int]]:
+    async with new_session() as session:
+        query = select(LinkClickBucket.bucket_start, LinkClickBucket.clicks).filter(
+            LinkClickBucket.slug == slug,
+            LinkClickBucket.granularity.in_(granularities),
+            LinkClickBucket.bucket_start >= since,
+        )
+        result = await session.execute(query)
+        return [(bucket_start, clicks) for bucket_start, clicks in result.all()]
+
+
+async def get_total_clicks_from_database(slug: str) -> int:
+    async with new_session() as session:
+        query = select(LinkClickTotal.clicks).filter_by(slug=slug)
+        result = await session.execute(query)
+        return result.scalar_one_or_none() or 0
+
+
+async def get_top_slugs_from_database(limit: int) -> list[tuple[str, int]]:
+    async with new_session() as session:
+        query = select(LinkClickTotal.slug, LinkClickTotal.clicks).order_by(LinkClickTotal.clicks.desc()).limit(limit)
+        result = await session.execute(query)
+        return [(slug, clicks) for slug, clicks in result.all()]
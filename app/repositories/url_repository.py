@@ -6,9 +6,9 @@ from app.models.url import ShortURL
 from app.exceptions.url_exceptions import SlugAlreadyExistsError
 
 
-async def add_slug_to_db(slug: str, long_url: str) -> None:
+async def add_slug_to_db(slug: str, long_url: str, redirect_status: int | None = None) -> None:
     async with new_session() as session:
-        new_slug = ShortURL(slug=slug, long_url=long_url)
+        new_slug = ShortURL(slug=slug, long_url=long_url, redirect_status=redirect_status)
         session.add(new_slug)
         try:
             await session.commit()
@@ -24,9 +24,29 @@ async def get_long_url_by_slug_from_database(slug: str) -> str | None:
         return res.long_url if res else None
 
 
-async def get_slug_by_long_url_from_database(long_url: str) -> str | None:
+async def get_short_url_by_slug_from_database(slug: str) -> ShortURL | None:
     async with new_session() as session:
-        query = select(ShortURL).filter_by(long_url=long_url)
+        query = select(ShortURL).filter_by(slug=slug)
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
+
+
+async def get_slug_by_long_url_from_database(long_url: str, redirect_status: int | None = None) -> str | None:
+    async with new_session() as session:
+        query = select(ShortURL).filter_by(long_url=long_url, redirect_status=redirect_status)
         result = await session.execute(query)
         res: ShortURL | None = result.scalar_one_or_none()
         return res.slug if res else None
+
+
+async def get_short_urls_batch_from_database(after: str | None, limit: int) -> list[ShortURL]:
+    async with new_session() as session:
+        # The snapshot needs slugs in byte order; SQLite compares text bytewise already
+        slug = ShortURL.slug
+        if session.bind.dialect.name == "postgresql":
+            slug = slug.collate("C")
+        query = select(ShortURL).order_by(slug).limit(limit)
+        if after is not None:
+            query = query.filter(slug > after)
+        result = await session.execute(query)
+        return list(result.scalars().all())
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+Granularity = Literal["minute", "hour", "day"]
+
+
+class ClickBucket(BaseModel):
+    bucket_start: datetime
+    clicks: int
+
+
+class SlugStatsData(BaseModel):
+    slug: str
+    granularity: Granularity
+    total_clicks: int
+    series: list[ClickBucket]
+
+
+class SlugStatsResponse(BaseModel):
+    data: SlugStatsData
+
+
+class TopLink(BaseModel):
+    slug: str
+    clicks: int
+
+
+class TopLinksResponse(BaseModel):
+    data: list[TopLink]
@@ -1,8 +1,13 @@
+from typing import Literal
+
 from pydantic import BaseModel, HttpUrl
 
+RedirectStatus = Literal[301, 302, 307, 308]
+
 
 class ShortUrlRequest(BaseModel):
     long_url: HttpUrl
+    redirect_status: RedirectStatus | None = None
 
 
 class ShortURLData(BaseModel):
@@ -0,0 +1,79 @@
+import argparse
+import importlib.util
+import logging
+import os
+
+import uvicorn
+
+from app.core.config import Settings, settings
+
+logger = logging.getLogger("app.server")
+
+# Optional accelerated implementations and what uvicorn falls back to without them
+LOOP_FALLBACKS: dict[str, str] = {"uvloop": "asyncio"}
+HTTP_FALLBACKS: dict[str, str] = {"httptools": "h11"}
+
+
+def _resolve_implementation(requested: str, fallbacks: dict[str, str]) -> str:
+    if requested in fallbacks and importlib.util.find_spec(requested) is None:
+        logger.warning("%s is not installed, falling back to %s", requested, fallbacks[requested])
+        return fallbacks[requested]
+    return requested
+
+
+def available_cpus() -> int:
+    # cpu_count() reports every host CPU even when the container is pinned to a few
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def build_server_config(config: Settings = settings) -> dict:
+    return {
+        "host": config.server_host,
+        "port": config.server_port,
+        "workers": config.server_workers or available_cpus(),
+        "loop": _resolve_implementation(config.server_loop, LOOP_FALLBACKS),
+        "http": _resolve_implementation(config.server_http, HTTP_FALLBACKS),
+        "backlog": config.server_backlog,
+        "timeout_keep_alive": config.server_keep_alive_timeout,
+        "timeout_graceful_shutdown": config.server_graceful_shutdown_timeout,
+    }
+
+
+def check_db_connections(server_config: dict, config: Settings = settings) -> bool:
+    # Every worker has its own SQLAlchemy pool
+    connections = server_config["workers"] * (config.db_pool_size + config.db_max_overflow)
+    if connections > config.server_max_db_connections:
+        logger.warning(
+            "%d workers may open up to %d database connections, above the limit of %d; "
+            "lower SERVER_WORKERS or DB_POOL_SIZE/DB_MAX_OVERFLOW",
+            server_config["workers"], connections, config.server_max_db_connections,
+        )
+        return False
+    return True
+
+
+def describe_server_config(server_config: dict) -> str:
+    return ", ".join(f"{key}={value}" for key, value in server_config.items())
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the Shortify API server")
+    parser.add_argument("--check", action="store_true", help="print the resolved configuration and exit")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    server_config = build_server_config()
+    logger.info("Server configuration: %s", describe_server_config(server_config))
+    check_db_connections(server_config)
+    if args.check:
+        return
+
+    # Shutdown waits for in-flight requests up to the graceful timeout,
+    # then the app lifespan flushes buffered click statistics
+    uvicorn.run("app.main:app", **server_config)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+
+from app.core.config import settings
+from app.core.database import db_breaker, stats_breaker
+from app.exceptions.url_exceptions import NoLongUrlFoundError, DatabaseUnavailableError
+from app.repositories.stats_repository import (
+    add_clicks_to_db,
+    compact_click_buckets_in_db,
+    get_click_buckets_from_database,
+    get_top_slugs_from_database,
+    get_total_clicks_from_database,
+)
+from app.repositories.url_repository import get_long_url_by_slug_from_database
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Ordered from finest to coarsest
+GRANULARITY_SECONDS: dict[str, int] = {
+    "minute": 60,
+    "hour": 60 * 60,
+    "day": 24 * 60 * 60,
+}
+
+
+def max_buckets(granularity: str) -> int:
+    # Finer rollups are compacted away, so older buckets would read as zero
+    if granularity == "minute":
+        return settings.stats_minute_retention // GRANULARITY_SECONDS["minute"]
+    if granularity == "hour":
+        return settings.stats_hour_retention // GRANULARITY_SECONDS["hour"]
+    return settings.stats_max_buckets
+
+
+def floor_to_bucket(timestamp: float, granularity: str) -> int:
+    step = GRANULARITY_SECONDS[granularity]
+    return int(timestamp) - int(timestamp) % step
+
+
+class ClickBuffer:
+
+    def __init__(self):
+        self._buckets: dict[tuple[str, str, int], int] = defaultdict(int)
+        self._totals: dict[str, int] = defaultdict(int)
+
+    def record(self, slug: str, timestamp: float | None = None) -> None:
+        if timestamp is None:
+            timestamp = time.time()
+        self._buckets[(slug, "minute", floor_to_bucket(timestamp, "minute"))] += 1
+        self._totals[slug] += 1
+
+    async def flush(self) -> None:
+        if not self._totals:
+            return
+        buckets, totals = self._buckets, self._totals
+        self._buckets, self._totals = defaultdict(int), defaultdict(int)
+        commit_sent = False
+
+        def mark_commit_sent() -> None:
+            nonlocal commit_sent
+            commit_sent = True
+
+        try:
+            await stats_breaker.call(
+                add_clicks_to_db, buckets, totals,
+                on_commit=mark_commit_sent,
+                timeout=settings.stats_write_timeout,
+            )
+        except BaseException:
+            # Once COMMIT is sent the batch may already be stored, so retrying
+            # it could count the clicks twice
+            if commit_sent:
+                raise
+            # Put the counts back so the next flush retries them, including
+            # when the worker is cancelled mid-flush on shutdown
+            for key, clicks in buckets.items():
+                self._buckets[key] += clicks
+            for slug, clicks in totals.items():
+                self._totals[slug] += clicks
+            raise
+
+
+click_buffer = ClickBuffer()
+stats_cache = TTLCache(ttl=settings.stats_cache_ttl)
+
+
+async def compact_stats(now: float | None = None) -> None:
+    if now is None:
+        now = time.time()
+    await stats_breaker.call(
+        compact_click_buckets_in_db,
+        "minute", "hour", GRANULARITY_SECONDS["hour"],
+        before=floor_to_bucket(now - settings.stats_minute_retention, "hour"),
+        timeout=settings.stats_compaction_timeout,
+    )
+    await stats_breaker.call(
+        compact_click_buckets_in_db,
+        "hour", "day", GRANULARITY_SECONDS["day"],
+        before=floor_to_bucket(now - settings.stats_hour_retention, "day"),
+        timeout=settings.stats_compaction_timeout,
+    )
+
+
+async def run_stats_worker() -> None:
+    last_compaction = time.monotonic()
+    while True:
+        await asyncio.sleep(settings.stats_flush_interval)
+        # Keep buffering while either breaker is open instead of hitting the database
+        if db_breaker.state == "open" or stats_breaker.state == "open":
+            continue
+        try:
+            await click_buffer.flush()
+            if time.monotonic() - last_compaction >= settings.stats_compaction_interval:
+                await compact_stats()
+                last_compaction = time.monotonic()
+        except DatabaseUnavailableError:
+            logger.warning("Database unavailable, keeping link statistics buffered")
+        except Exception:
+            logger.exception("Failed to update link statistics")
+
+
+async def get_click_series(slug: str, granularity: str, buckets: int, now: float | None = None) -> dict:
+    cache_key = ("series", slug, granularity, buckets)
+    cached = stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if not await stats_breaker.call(get_long_url_by_slug_from_database, slug):
+        raise NoLongUrlFoundError()
+
+    if now is None:
+        now = time.time()
+    step = GRANULARITY_SECONDS[granularity]
+    last_bucket = floor_to_bucket(now, granularity)
+    first_bucket = last_bucket - (buckets - 1) * step
+
+    # Coarser rows cannot be split, so only equal or finer rollups are read
+    names = list(GRANULARITY_SECONDS)
+    granularities = names[:names.index(granularity) + 1]
+    counts: dict[int, int] = defaultdict(int)
+    for bucket_start, clicks in await stats_breaker.call(
+        get_click_buckets_from_database, slug, granularities, first_bucket
+    ):
+        counts[floor_to_bucket(bucket_start, granularity)] += clicks
+
+    result = {
+        "slug": slug,
+        "granularity": granularity,
+        "total_clicks": await stats_breaker.call(get_total_clicks_from_database, slug),
+        "series": [
+            {"bucket_start": start, "clicks": counts.get(start, 0)}
+            for start in range(first_bucket, last_bucket + step, step)
+        ],
+    }
+    stats_cache.set(cache_key, result)
+    return result
+
+
+async def get_top_links(limit: int) -> list[dict]:
+    cache_key = ("top", limit)
+    cached = stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = [
+        {"slug": slug, "clicks": clicks}
+        for slug, clicks in await stats_breaker.call(get_top_slugs_from_database, limit)
+    ]
+    stats_cache.set(cache_key, result)
+    return result
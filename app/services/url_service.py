@@ -1,25 +1,94 @@
+import asyncio
+import logging
+
 from app.repositories.url_repository import (
     add_slug_to_db, 
-    get_long_url_by_slug_from_database,
-    get_slug_by_long_url_from_database
+    get_short_url_by_slug_from_database,
+    get_slug_by_long_url_from_database,
+    get_short_urls_batch_from_database
 )
 
-from app.exceptions.url_exceptions import NoLongUrlFoundError
+from app.core.config import settings
+from app.core.database import db_breaker
+from app.models.url import ShortURL
+from app.exceptions.url_exceptions import NoLongUrlFoundError, DatabaseUnavailableError
 from app.utils.slug_generator import generate_random_slug
+from app.utils.url_snapshot import SnapshotWriter, UrlSnapshot, snapshot_lock
+
+logger = logging.getLogger(__name__)
 
+url_snapshot = UrlSnapshot(settings.url_snapshot_path)
 
-async def generate_short_url(long_url: str) -> str:
-    existing_slug = await get_slug_by_long_url_from_database(long_url)
+
+async def generate_short_url(long_url: str, redirect_status: int | None = None) -> str:
+    existing_slug = await db_breaker.call(get_slug_by_long_url_from_database, long_url, redirect_status)
     if existing_slug:
         return existing_slug
     
     slug = generate_random_slug()
-    await add_slug_to_db(slug, long_url)
+    await db_breaker.call(add_slug_to_db, slug, long_url, redirect_status)
     return slug
 
 
-async def get_url_by_slug(slug: str) -> str:
-    long_url = await get_long_url_by_slug_from_database(slug)
-    if not long_url:
+async def get_short_url_by_slug(slug: str) -> ShortURL:
+    try:
+        short_url = await db_breaker.call(get_short_url_by_slug_from_database, slug)
+    except DatabaseUnavailableError:
+        # Mappings never change, so the last snapshot is safe to serve
+        entry = url_snapshot.get(slug)
+        if entry is None:
+            raise
+        short_url = ShortURL(
+            slug=slug,
+            long_url=entry.long_url,
+            redirect_status=entry.redirect_status,
+            created_at=entry.created_at,
+        )
+    if not short_url:
         raise NoLongUrlFoundError()
-    return long_url
+    return short_url
+
+
+async def get_url_by_slug(slug: str) -> str:
+    short_url = await get_short_url_by_slug(slug)
+    return short_url.long_url
+
+
+async def refresh_url_snapshot() -> None:
+    writer = SnapshotWriter(url_snapshot.path)
+    try:
+        after = None
+        while True:
+            batch = await db_breaker.call(get_short_urls_batch_from_database, after, settings.url_snapshot_batch_size)
+            for short_url in batch:
+                writer.add(short_url.slug, short_url.long_url, short_url.redirect_status, short_url.created_at)
+            if len(batch) < settings.url_snapshot_batch_size:
+                break
+            after = batch[-1].slug
+        await asyncio.to_thread(writer.commit)
+    except BaseException:
+        writer.abort()
+        raise
+    url_snapshot.reload()
+
+
+async def refresh_url_snapshot_if_stale() -> bool:
+    # Only one worker per host rebuilds the file, the others remap it
+    with snapshot_lock(url_snapshot.path) as acquired:
+        file_age = url_snapshot.file_age
+        if acquired and (file_age is None or file_age >= settings.url_snapshot_refresh_interval):
+            await refresh_url_snapshot()
+            return True
+    url_snapshot.reload()
+    return False
+
+
+async def run_snapshot_worker() -> None:
+    while True:
+        try:
+            await refresh_url_snapshot_if_stale()
+        except DatabaseUnavailableError:
+            logger.warning("Database unavailable, keeping the previous url snapshot")
+        except Exception:
+            logger.exception("Failed to refresh the url snapshot")
+        await asyncio.sleep(settings.url_snapshot_refresh_interval)
@@ -0,0 +1,69 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.exceptions.url_exceptions import DatabaseUnavailableError
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        call_timeout: float = 2.0,
+        expected_exceptions: tuple[type[BaseException], ...] = (SQLAlchemyError, OSError, TimeoutError),
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.call_timeout = call_timeout
+        self.expected_exceptions = expected_exceptions
+        self.reset()
+
+    def reset(self) -> None:
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    async def call(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_in_flight):
+            raise DatabaseUnavailableError()
+
+        # Only a single trial call is let through while half open, and only
+        # that call may clear the flag or close the breaker again
+        is_trial = state == "half_open"
+        if is_trial:
+            self._trial_in_flight = True
+        try:
+            result = await asyncio.wait_for(func(*args, **kwargs), timeout=timeout or self.call_timeout)
+        except self.expected_exceptions as exc:
+            self._record_failure()
+            raise DatabaseUnavailableError() from exc
+        finally:
+            if is_trial:
+                self._trial_in_flight = False
+        if is_trial or self._opened_at is None:
+            self._failures = 0
+            self._opened_at = None
+        return result
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
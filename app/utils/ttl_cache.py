@@ -0,0 +1,28 @@
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            # Drop the oldest entry, dicts keep insertion order
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,196 @@
+import math
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# File layout:
+#   records:  [slug length: u16][url length: u32][redirect status: u16][link created at: f64][slug][url] ...
+#   index:    [record offset: u64] ... in the same slug byte order as the records
+#   footer:   [magic][created at: f64][record count: u64][index offset: u64]
+# A redirect status of 0 and a NaN creation time mean the value is not set.
+MAGIC = b"SHRTSNP2"
+_FOOTER = struct.Struct("<8sdQQ")
+_RECORD_HEADER = struct.Struct("<HIHd")
+_OFFSET = struct.Struct("<Q")
+
+
+class SnapshotEntry(NamedTuple):
+    long_url: str
+    redirect_status: int | None
+    created_at: datetime | None
+
+
+@contextmanager
+def snapshot_lock(path: str | Path) -> Iterator[bool]:
+    # Yields whether this process holds the lock; other workers sharing the disk get False
+    lock_path = Path(f"{path}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        if fcntl is None:
+            yield True
+            return
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class SnapshotWriter:
+    # Records must arrive sorted by slug bytes; offsets are spooled to a
+    # temporary file so memory use does not grow with the table
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        self._offsets = tempfile.TemporaryFile(dir=self.path.parent)
+        self._count = 0
+        self._last_slug: bytes | None = None
+        self._position = 0
+
+    def add(
+        self,
+        slug: str,
+        long_url: str,
+        redirect_status: int | None = None,
+        created_at: datetime | None = None,
+    ) -> None:
+        slug_bytes = slug.encode()
+        url_bytes = long_url.encode()
+        if self._last_slug is not None and slug_bytes <= self._last_slug:
+            raise ValueError("Snapshot records must be added in increasing slug order")
+        if created_at is not None and created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        self._offsets.write(_OFFSET.pack(self._position))
+        self._last_slug = slug_bytes
+        self._count += 1
+        self._file.write(_RECORD_HEADER.pack(
+            len(slug_bytes),
+            len(url_bytes),
+            redirect_status or 0,
+            created_at.timestamp() if created_at is not None else math.nan,
+        ))
+        self._file.write(slug_bytes)
+        self._file.write(url_bytes)
+        self._position += _RECORD_HEADER.size + len(slug_bytes) + len(url_bytes)
+
+    def commit(self, created_at: float | None = None) -> None:
+        self._offsets.seek(0)
+        shutil.copyfileobj(self._offsets, self._file)
+        self._offsets.close()
+        self._file.write(_FOOTER.pack(
+            MAGIC,
+            time.time() if created_at is None else created_at,
+            self._count,
+            self._position,
+        ))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        # Readers only ever see a complete file
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        self._offsets.close()
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.unlink(self._tmp_path)
+
+
+class UrlSnapshot:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._mmap: mmap.mmap | None = None
+        self._count = 0
+        self._index_offset = 0
+        self.created_at: float | None = None
+
+    def _load(self) -> bool:
+        if self._mmap is not None:
+            return True
+        try:
+            with open(self.path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Missing or empty file
+            return False
+        if len(mapped) < _FOOTER.size:
+            mapped.close()
+            return False
+        magic, created_at, count, index_offset = _FOOTER.unpack_from(mapped, len(mapped) - _FOOTER.size)
+        if magic != MAGIC:
+            mapped.close()
+            return False
+        self._mmap = mapped
+        self._count = count
+        self._index_offset = index_offset
+        self.created_at = created_at
+        return True
+
+    def reload(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = None
+        self.created_at = None
+
+    @property
+    def file_age(self) -> float | None:
+        # Age of the file on disk, which may be newer than the mapped one
+        try:
+            return max(time.time() - self.path.stat().st_mtime, 0.0)
+        except FileNotFoundError:
+            return None
+
+    @property
+    def age(self) -> float | None:
+        if not self._load():
+            return None
+        return max(time.time() - self.created_at, 0.0)
+
+    def _slug_at(self, position: int) -> tuple[bytes, int]:
+        offset = _OFFSET.unpack_from(self._mmap, self._index_offset + position * _OFFSET.size)[0]
+        slug_length = _RECORD_HEADER.unpack_from(self._mmap, offset)[0]
+        slug_start = offset + _RECORD_HEADER.size
+        return self._mmap[slug_start:slug_start + slug_length], offset
+
+    def _entry_at(self, offset: int) -> SnapshotEntry:
+        slug_length, url_length, redirect_status, created_at = _RECORD_HEADER.unpack_from(self._mmap, offset)
+        url_start = offset + _RECORD_HEADER.size + slug_length
+        return SnapshotEntry(
+            long_url=self._mmap[url_start:url_start + url_length].decode(),
+            redirect_status=redirect_status or None,
+            created_at=None if math.isnan(created_at) else datetime.fromtimestamp(created_at, tz=timezone.utc),
+        )
+
+    def get(self, slug: str) -> SnapshotEntry | None:
+        if not self._load():
+            return None
+        target = slug.encode()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            current, offset = self._slug_at(middle)
+            if current == target:
+                return self._entry_at(offset)
+            if current < target:
+                low = middle + 1
+            else:
+                high = middle
+        return None
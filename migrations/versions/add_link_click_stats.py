@@ -0,0 +1,49 @@
+"""Add link click rollup tables
+
+Revision ID: add_link_click_stats
+Revises: add_index_long_url
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_link_click_stats'
+down_revision: Union[str, None] = 'add_index_long_url'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'link_click_buckets',
+        sa.Column('slug', sa.String(), nullable=False),
+        sa.Column('granularity', sa.String(), nullable=False),
+        sa.Column('bucket_start', sa.BigInteger(), nullable=False),
+        sa.Column('clicks', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('slug', 'granularity', 'bucket_start'),
+    )
+    op.create_index(
+        'ix_link_click_buckets_granularity_bucket_start',
+        'link_click_buckets',
+        ['granularity', 'bucket_start'],
+        unique=False,
+    )
+    op.create_table(
+        'link_click_totals',
+        sa.Column('slug', sa.String(), nullable=False),
+        sa.Column('clicks', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('slug'),
+    )
+    op.create_index(op.f('ix_link_click_totals_clicks'), 'link_click_totals', ['clicks'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_link_click_totals_clicks'), table_name='link_click_totals')
+    op.drop_table('link_click_totals')
+    op.drop_index('ix_link_click_buckets_granularity_bucket_start', table_name='link_click_buckets')
+    op.drop_table('link_click_buckets')
@@ -0,0 +1,31 @@
+"""Add redirect status and creation time to short urls
+
+Revision ID: add_redirect_cache_columns
+Revises: add_link_click_stats
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_redirect_cache_columns'
+down_revision: Union[str, None] = 'add_link_click_stats'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('short_urls', sa.Column('redirect_status', sa.Integer(), nullable=True))
+    op.add_column(
+        'short_urls',
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('short_urls', 'created_at')
+    op.drop_column('short_urls', 'redirect_status')
@@ -0,0 +1,28 @@
+"""Add byte-ordered slug index for the redirect snapshot
+
+Revision ID: add_snapshot_slug_index
+Revises: add_redirect_cache_columns
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_snapshot_slug_index'
+down_revision: Union[str, None] = 'add_redirect_cache_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index('ix_short_urls_slug_c', 'short_urls', [sa.text('slug COLLATE "C"')], unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_short_urls_slug_c', table_name='short_urls')
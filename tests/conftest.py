@@ -24,8 +24,8 @@ db_module.engine = test_engine
 db_module.new_session = TestSessionLocal
 
 # NOW we import the models and the rest
-from app.models.url import Base
-from app.api.routes import urls
+from app.models import Base
+from app.api.routes import stats, urls
 
 
 @pytest.fixture(scope="function")
@@ -50,6 +50,7 @@ async def test_app(setup_test_db):
         description="URL Shortener Service - Test",
         version="0.1.0"
     )
+    app.include_router(stats.router)
     app.include_router(urls.router)
     return app
 
@@ -0,0 +1,216 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+import app.services.stats_service as stats_service
+import app.services.url_service as url_service
+from app.exceptions.url_exceptions import DatabaseUnavailableError
+from app.repositories.url_repository import add_slug_to_db
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.url_snapshot import SnapshotWriter, UrlSnapshot, snapshot_lock
+
+
+async def failing_query(*args):
+    raise OperationalError("SELECT 1", {}, ConnectionRefusedError())
+
+
+@pytest.fixture
+def snapshot(tmp_path, monkeypatch):
+    """Points the service at an empty snapshot in a temporary directory"""
+    url_snapshot = UrlSnapshot(tmp_path / "url_snapshot.bin")
+    monkeypatch.setattr(url_service, "url_snapshot", url_snapshot)
+    url_service.db_breaker.reset()
+    stats_service.stats_breaker.reset()
+    yield url_snapshot
+    url_snapshot.reload()
+    url_service.db_breaker.reset()
+    stats_service.stats_breaker.reset()
+
+
+def test_snapshot_roundtrip(tmp_path):
+    """Written mappings can be looked up by slug"""
+    path = tmp_path / "snapshot.bin"
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    writer = SnapshotWriter(path)
+    writer.add("aaa", "https://a.example", 308, created_at)
+    writer.add("mmm", "https://m.example")
+    writer.add("zzz", "https://z.example")
+    writer.commit(created_at=100.0)
+
+    snapshot = UrlSnapshot(path)
+    assert snapshot.get("aaa") == ("https://a.example", 308, created_at)
+    assert snapshot.get("mmm") == ("https://m.example", None, None)
+    assert snapshot.get("zzz").long_url == "https://z.example"
+    assert snapshot.get("nope") is None
+    assert snapshot.created_at == 100.0
+
+
+def test_snapshot_rejects_unsorted_records(tmp_path):
+    """Records have to be streamed in slug byte order"""
+    writer = SnapshotWriter(tmp_path / "snapshot.bin")
+    writer.add("mmm", "https://m.example")
+
+    with pytest.raises(ValueError):
+        writer.add("aaa", "https://a.example")
+    writer.abort()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_refresh_across_batches(setup_test_db, snapshot, monkeypatch):
+    """Mixed-case slugs stay findable when the table is read in several batches"""
+    monkeypatch.setattr(url_service.settings, "url_snapshot_batch_size", 2)
+    for slug in ("b", "A", "a", "Z", "0"):
+        await add_slug_to_db(slug, f"https://example.com/{slug}")
+
+    await url_service.refresh_url_snapshot()
+
+    for slug in ("b", "A", "a", "Z", "0"):
+        assert snapshot.get(slug).long_url == f"https://example.com/{slug}"
+
+
+def test_snapshot_missing_file(tmp_path):
+    """A missing snapshot behaves as empty"""
+    snapshot = UrlSnapshot(tmp_path / "missing.bin")
+
+    assert snapshot.get("abc123") is None
+    assert snapshot.age is None
+
+
+def test_snapshot_lock_is_exclusive(tmp_path):
+    """Only one holder of the snapshot lock at a time"""
+    path = tmp_path / "snapshot.bin"
+
+    with snapshot_lock(path) as first:
+        with snapshot_lock(path) as second:
+            assert first is True
+            assert second is False
+
+
+@pytest.mark.asyncio
+async def test_fresh_snapshot_is_not_rebuilt(setup_test_db, snapshot, monkeypatch):
+    """Workers skip the table scan while the file on disk is fresh"""
+    assert await url_service.refresh_url_snapshot_if_stale() is True
+    assert await url_service.refresh_url_snapshot_if_stale() is False
+
+    monkeypatch.setattr(url_service.settings, "url_snapshot_refresh_interval", 0)
+    assert await url_service.refresh_url_snapshot_if_stale() is True
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_repeated_failures():
+    """The breaker fails fast once the failure threshold is reached"""
+    calls = 0
+
+    async def query():
+        nonlocal calls
+        calls += 1
+        raise OSError("connection refused")
+
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    for _ in range(2):
+        with pytest.raises(DatabaseUnavailableError):
+            await breaker.call(query)
+    assert breaker.state == "open"
+
+    with pytest.raises(DatabaseUnavailableError):
+        await breaker.call(query)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_breaker_closes_after_successful_trial():
+    """A successful call while half open closes the breaker"""
+    async def failing():
+        raise OSError("connection refused")
+
+    async def succeeding():
+        return "ok"
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    with pytest.raises(DatabaseUnavailableError):
+        await breaker.call(failing)
+    assert breaker.state == "half_open"
+
+    assert await breaker.call(succeeding) == "ok"
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_breaker_stale_call_does_not_reset_trial():
+    """A call started while closed cannot clear a later trial or close the breaker"""
+    release = asyncio.Event()
+    trial_started = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return "stale"
+
+    async def trial():
+        trial_started.set()
+        await asyncio.sleep(10)
+
+    async def failing():
+        raise OSError("connection refused")
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, call_timeout=30)
+    stale_call = asyncio.create_task(breaker.call(slow))
+    await asyncio.sleep(0)
+    with pytest.raises(DatabaseUnavailableError):
+        await breaker.call(failing)
+
+    trial_call = asyncio.create_task(breaker.call(trial))
+    await trial_started.wait()
+    release.set()
+    assert await stale_call == "stale"
+
+    assert breaker.state == "half_open"
+    second_trial = []
+
+    async def record_second_trial():
+        second_trial.append(True)
+
+    with pytest.raises(DatabaseUnavailableError):
+        await breaker.call(record_second_trial)
+    assert second_trial == []
+    trial_call.cancel()
+
+
+@pytest.mark.asyncio
+async def test_redirect_served_from_snapshot_when_database_down(setup_test_db, snapshot, monkeypatch):
+    """Slugs are resolved from the snapshot while the database is unreachable"""
+    slug = await url_service.generate_short_url("https://example.com/snapshot", 307)
+    await url_service.refresh_url_snapshot()
+
+    monkeypatch.setattr(url_service, "get_short_url_by_slug_from_database", failing_query)
+
+    short_url = await url_service.get_short_url_by_slug(slug)
+    assert short_url.long_url == "https://example.com/snapshot"
+    assert short_url.redirect_status == 307
+    assert short_url.created_at is not None
+    with pytest.raises(DatabaseUnavailableError):
+        await url_service.get_url_by_slug("nonexistent")
+
+
+def test_create_returns_503_when_database_down(client: TestClient, snapshot, monkeypatch):
+    """Creating links is rejected while the database is unreachable"""
+    monkeypatch.setattr(url_service, "get_slug_by_long_url_from_database", failing_query)
+
+    response = client.post(
+        "/api/v1/short_url",
+        json={"long_url": "https://example.com/down"}
+    )
+
+    assert response.status_code == 503
+
+
+def test_stats_return_503_when_database_down(client: TestClient, snapshot, monkeypatch):
+    """Stats endpoints fail fast with 503 while the database is unreachable"""
+    stats_service.stats_cache.clear()
+    monkeypatch.setattr(stats_service, "get_top_slugs_from_database", failing_query)
+    monkeypatch.setattr(stats_service, "get_long_url_by_slug_from_database", failing_query)
+
+    assert client.get("/api/v1/stats/top").status_code == 503
+    assert client.get("/api/v1/abc123/stats").status_code == 503
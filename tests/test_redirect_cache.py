@@ -0,0 +1,119 @@
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+
+def create_slug(client: TestClient, long_url: str, **options) -> str:
+    response = client.post(
+        "/api/v1/short_url",
+        json={"long_url": long_url, **options}
+    )
+    assert response.status_code == 200
+    return response.json()["data"]["short_code"]
+
+
+def test_redirect_has_validators(client: TestClient):
+    """Redirects carry an ETag, Last-Modified and Cache-Control"""
+    slug = create_slug(client, "https://example.com/validators")
+
+    response = client.get(f"/api/v1/{slug}", follow_redirects=False)
+
+    assert response.status_code == 302
+    assert response.headers["etag"].startswith('"')
+    assert "last-modified" in response.headers
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_redirect_global_max_age(client: TestClient, monkeypatch):
+    """A global max age makes redirects publicly cacheable"""
+    monkeypatch.setattr(settings, "redirect_cache_max_age", 3600)
+    slug = create_slug(client, "https://example.com/max-age")
+
+    response = client.get(f"/api/v1/{slug}", follow_redirects=False)
+
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+
+def test_redirect_per_link_status(client: TestClient):
+    """A link can be created with a permanent redirect status"""
+    slug = create_slug(client, "https://example.com/permanent", redirect_status=308)
+
+    response = client.get(f"/api/v1/{slug}", follow_redirects=False)
+
+    assert response.status_code == 308
+    assert response.headers["location"] == "https://example.com/permanent"
+
+
+def test_redirect_status_is_part_of_dedup(client: TestClient):
+    """The same URL with a different redirect status gets its own link"""
+    default_slug = create_slug(client, "https://example.com/dedup")
+    permanent_slug = create_slug(client, "https://example.com/dedup", redirect_status=308)
+
+    assert permanent_slug != default_slug
+    assert create_slug(client, "https://example.com/dedup", redirect_status=308) == permanent_slug
+    assert create_slug(client, "https://example.com/dedup") == default_slug
+    assert client.get(f"/api/v1/{default_slug}", follow_redirects=False).status_code == 302
+    assert client.get(f"/api/v1/{permanent_slug}", follow_redirects=False).status_code == 308
+
+
+def test_redirect_invalid_status(client: TestClient):
+    """Only redirect status codes are accepted"""
+    response = client.post(
+        "/api/v1/short_url",
+        json={"long_url": "https://example.com/invalid", "redirect_status": 200}
+    )
+
+    assert response.status_code == 422
+
+
+def test_redirect_if_none_match(client: TestClient):
+    """A matching If-None-Match yields 304 Not Modified"""
+    slug = create_slug(client, "https://example.com/etag")
+    etag = client.get(f"/api/v1/{slug}", follow_redirects=False).headers["etag"]
+
+    response = client.get(
+        f"/api/v1/{slug}",
+        headers={"If-None-Match": etag},
+        follow_redirects=False
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+    response = client.get(
+        f"/api/v1/{slug}",
+        headers={"If-None-Match": '"other"'},
+        follow_redirects=False
+    )
+    assert response.status_code == 302
+
+
+def test_redirect_if_modified_since(client: TestClient):
+    """An If-Modified-Since at or after creation yields 304"""
+    slug = create_slug(client, "https://example.com/modified")
+    last_modified = client.get(f"/api/v1/{slug}", follow_redirects=False).headers["last-modified"]
+
+    response = client.get(
+        f"/api/v1/{slug}",
+        headers={"If-Modified-Since": last_modified},
+        follow_redirects=False
+    )
+    assert response.status_code == 304
+
+    response = client.get(
+        f"/api/v1/{slug}",
+        headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+        follow_redirects=False
+    )
+    assert response.status_code == 302
+
+
+def test_redirect_head(client: TestClient):
+    """HEAD returns the redirect headers without a body"""
+    slug = create_slug(client, "https://example.com/head")
+
+    response = client.head(f"/api/v1/{slug}", follow_redirects=False)
+
+    assert response.status_code == 302
+    assert response.headers["location"] == "https://example.com/head"
+    assert "etag" in response.headers
+    assert response.content == b""
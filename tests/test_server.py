@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+from app.server import build_server_config, check_db_connections
+
+
+def test_server_config_defaults_to_available_cpus():
+    """Worker count follows the CPUs this process may run on, not the host total"""
+    with patch("app.server.os.sched_getaffinity", return_value={0, 1}, create=True), \
+            patch("app.server.os.cpu_count", return_value=64):
+        config = build_server_config(Settings(server_workers=None))
+
+    assert config["workers"] == 2
+
+
+def test_server_config_cpu_count_fallback(monkeypatch):
+    """Platforms without sched_getaffinity fall back to cpu_count"""
+    monkeypatch.delattr("app.server.os.sched_getaffinity", raising=False)
+    with patch("app.server.os.cpu_count", return_value=8):
+        config = build_server_config(Settings(server_workers=None))
+
+    assert config["workers"] == 8
+
+
+def test_db_connection_check():
+    """Too many workers for the database connection budget are reported"""
+    config = Settings(db_pool_size=5, db_max_overflow=10, server_max_db_connections=100)
+
+    assert check_db_connections({"workers": 6}, config) is True
+    assert check_db_connections({"workers": 7}, config) is False
+
+
+def test_server_config_explicit_workers():
+    """An explicit worker count is used as is"""
+    config = build_server_config(Settings(server_workers=3, server_backlog=512))
+
+    assert config["workers"] == 3
+    assert config["backlog"] == 512
+
+
+def test_server_config_falls_back_without_accelerators():
+    """Missing uvloop/httptools fall back to the pure Python implementations"""
+    with patch("app.server.importlib.util.find_spec", return_value=None):
+        config = build_server_config(Settings())
+
+    assert config["loop"] == "asyncio"
+    assert config["http"] == "h11"
+
+
+def test_settings_redirect_status_from_environment(monkeypatch):
+    """Redirect status codes from the environment are parsed and validated"""
+    monkeypatch.setenv("REDIRECT_STATUS_CODE", "308")
+    assert Settings().redirect_status_code == 308
+
+    monkeypatch.setenv("REDIRECT_STATUS_CODE", "200")
+    with pytest.raises(ValidationError):
+        Settings()
@@ -0,0 +1,232 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.services.stats_service as stats_service
+from app.core.config import settings
+from app.core.database import db_breaker, stats_breaker
+from app.exceptions.url_exceptions import DatabaseUnavailableError
+from app.services.url_service import generate_short_url
+from app.services.stats_service import (
+    click_buffer,
+    compact_stats,
+    floor_to_bucket,
+    get_click_series,
+    get_top_links,
+    max_buckets,
+    stats_cache,
+)
+from app.repositories.stats_repository import get_click_buckets_from_database
+
+NOW = 1_760_000_000
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_state():
+    """Resets the shared click buffer and response cache between tests"""
+    stats_cache.clear()
+    stats_breaker.reset()
+    click_buffer._buckets.clear()
+    click_buffer._totals.clear()
+    yield
+    stats_cache.clear()
+    stats_breaker.reset()
+
+
+@pytest.mark.asyncio
+async def test_flush_aggregates_clicks_into_minute_buckets(setup_test_db):
+    """Clicks in the same minute are written as a single bucket"""
+    slug = await generate_short_url("https://example.com/stats")
+
+    for offset in (0, 10, 20, 70):
+        click_buffer.record(slug, timestamp=NOW + offset)
+    await click_buffer.flush()
+
+    rows = await get_click_buckets_from_database(slug, ["minute"], 0)
+    assert sorted(clicks for _, clicks in rows) == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_flush_accumulates_across_batches(setup_test_db):
+    """Repeated flushes add to existing buckets and totals"""
+    slug = await generate_short_url("https://example.com/batches")
+
+    click_buffer.record(slug, timestamp=NOW)
+    await click_buffer.flush()
+    click_buffer.record(slug, timestamp=NOW)
+    await click_buffer.flush()
+
+    series = await get_click_series(slug, "minute", 1, now=NOW)
+    assert series["total_clicks"] == 2
+    assert series["series"][-1]["clicks"] == 2
+
+
+@pytest.mark.asyncio
+async def test_flush_more_rows_than_one_batch(setup_test_db, monkeypatch):
+    """Flushes larger than one upsert batch are split across statements"""
+    monkeypatch.setattr("app.repositories.stats_repository.UPSERT_BATCH_SIZE", 2)
+    slug = await generate_short_url("https://example.com/batched")
+
+    for minute in range(5):
+        click_buffer.record(slug, timestamp=NOW + minute * 60)
+    await click_buffer.flush()
+
+    rows = await get_click_buckets_from_database(slug, ["minute"], 0)
+    assert len(rows) == 5
+    assert await get_top_links(1) == [{"slug": slug, "clicks": 5}]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flush_keeps_clicks(setup_test_db, monkeypatch):
+    """Clicks stay buffered when a flush is cancelled mid-write"""
+    started = asyncio.Event()
+
+    async def slow_add_clicks(buckets, totals, on_commit=None):
+        started.set()
+        await asyncio.sleep(10)
+
+    monkeypatch.setattr(stats_service, "add_clicks_to_db", slow_add_clicks)
+    click_buffer.record("abc123", timestamp=NOW)
+
+    task = asyncio.create_task(click_buffer.flush())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert click_buffer._totals == {"abc123": 1}
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_is_not_retried(setup_test_db, monkeypatch):
+    """Clicks are not put back once COMMIT has been sent"""
+    async def add_clicks_failing_on_commit(buckets, totals, on_commit=None):
+        on_commit()
+        raise OSError("connection lost during commit")
+
+    monkeypatch.setattr(stats_service, "add_clicks_to_db", add_clicks_failing_on_commit)
+    click_buffer.record("abc123", timestamp=NOW)
+
+    with pytest.raises(DatabaseUnavailableError):
+        await click_buffer.flush()
+
+    assert click_buffer._totals == {}
+
+
+@pytest.mark.asyncio
+async def test_stats_failures_do_not_trip_redirect_breaker(setup_test_db, monkeypatch):
+    """Slow or failing stats writes only open the stats breaker"""
+    async def failing_add_clicks(buckets, totals, on_commit=None):
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(stats_service, "add_clicks_to_db", failing_add_clicks)
+    for _ in range(settings.db_breaker_failure_threshold):
+        click_buffer.record("abc123", timestamp=NOW)
+        with pytest.raises(DatabaseUnavailableError):
+            await click_buffer.flush()
+
+    assert stats_breaker.state == "open"
+    assert db_breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_compaction_preserves_series(setup_test_db):
+    """Merging minute buckets into hours and days keeps the counts intact"""
+    slug = await generate_short_url("https://example.com/compact")
+    for hours_ago in (0, 5, 30, 100):
+        click_buffer.record(slug, timestamp=NOW - hours_ago * 3600)
+    await click_buffer.flush()
+
+    before = await get_click_series(slug, "day", 7, now=NOW)
+    stats_cache.clear()
+
+    await compact_stats(now=NOW)
+    after = await get_click_series(slug, "day", 7, now=NOW)
+
+    assert after == before
+    assert sum(bucket["clicks"] for bucket in after["series"]) == 4
+    assert len(await get_click_buckets_from_database(slug, ["minute"], 0)) == 1
+
+
+@pytest.mark.asyncio
+async def test_compaction_preserves_minute_and_hour_series(setup_test_db):
+    """Minute and hour series keep their counts within the retention window"""
+    slug = await generate_short_url("https://example.com/fine")
+    for seconds_ago in (30 * 60, 5 * 3600, 30 * 3600):
+        click_buffer.record(slug, timestamp=NOW - seconds_ago)
+    await click_buffer.flush()
+    await compact_stats(now=NOW)
+
+    minutes = await get_click_series(slug, "minute", max_buckets("minute"), now=NOW)
+    hours = await get_click_series(slug, "hour", max_buckets("hour"), now=NOW)
+
+    assert sum(bucket["clicks"] for bucket in minutes["series"]) == 1
+    assert sum(bucket["clicks"] for bucket in hours["series"]) == 3
+
+
+def test_slug_stats_buckets_beyond_retention(client: TestClient):
+    """Requests reaching past the retention of a granularity are rejected"""
+    response = client.get(
+        "/api/v1/abc123/stats",
+        params={"granularity": "minute", "buckets": max_buckets("minute") + 1}
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_top_links_ordered_by_clicks(setup_test_db):
+    """Top links are ordered by their total click count"""
+    quiet = await generate_short_url("https://example.com/quiet")
+    busy = await generate_short_url("https://example.com/busy")
+    click_buffer.record(quiet, timestamp=NOW)
+    for _ in range(3):
+        click_buffer.record(busy, timestamp=NOW)
+    await click_buffer.flush()
+
+    top = await get_top_links(10)
+    assert top == [{"slug": busy, "clicks": 3}, {"slug": quiet, "clicks": 1}]
+
+
+def test_slug_stats_endpoint(client: TestClient):
+    """Redirects are counted and exposed through the stats endpoint"""
+    create_response = client.post(
+        "/api/v1/short_url",
+        json={"long_url": "https://example.com/endpoint"}
+    )
+    slug = create_response.json()["data"]["short_code"]
+
+    with client as running:
+        for _ in range(2):
+            running.get(f"/api/v1/{slug}", follow_redirects=False)
+        running.portal.call(click_buffer.flush)
+        response = running.get(f"/api/v1/{slug}/stats", params={"granularity": "minute", "buckets": 5})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["total_clicks"] == 2
+    assert len(data["series"]) == 5
+    assert data["series"][-1]["clicks"] == 2
+
+
+def test_slug_stats_not_found(client: TestClient):
+    """Stats for a non-existent slug return 404"""
+    response = client.get("/api/v1/nonexistent/stats")
+
+    assert response.status_code == 404
+
+
+def test_slug_stats_invalid_granularity(client: TestClient):
+    """Unknown granularities are rejected"""
+    response = client.get("/api/v1/abc123/stats", params={"granularity": "week"})
+
+    assert response.status_code == 422
+
+
+def test_top_links_endpoint(client: TestClient):
+    """Top links endpoint serves the aggregated totals"""
+    response = client.get("/api/v1/stats/top", params={"limit": 5})
+
+    assert response.status_code == 200
+    assert response.json() == {"data": []}